@@ -3,21 +3,32 @@
 from __future__ import annotations
 
 import functools
+import gc
+import importlib.metadata
+import multiprocessing
+import os
+import shutil
 import time
-from typing import Generator
+from pathlib import Path
+from typing import Callable, Generator, List
 
 import pytest
 
 from benchmarks import WINDOWS_SKIP_REASON
 from reflex import constants
+from reflex.compiler import _subtree_cache as subtree_cache
 from reflex.compiler import utils
 from reflex.testing import AppHarness, chdir
-from reflex.utils import build
+from reflex.utils import build, prerequisites
 
 
 def render_component(num: int):
     """Generate a number of components based on num.
 
+    The four boxes and the fragment holding them are `rx.memo` components, so the
+    compiler emits one function per memo and the page only references the
+    fragment `num` times.
+
     Args:
         num: number of components to produce.
 
@@ -26,90 +37,109 @@ def render_component(num: int):
     """
     import reflex as rx
 
-    return [
-        rx.fragment(
-            rx.box(
-                rx.accordion.root(
-                    rx.accordion.item(
-                        header="Full Ingredients",  # type: ignore
-                        content="Yes. It's built with accessibility in mind.",  # type: ignore
-                        font_size="3em",
-                    ),
-                    rx.accordion.item(
-                        header="Applications",  # type: ignore
-                        content="Yes. It's unstyled by default, giving you freedom over the look and feel.",  # type: ignore
-                    ),
-                    collapsible=True,
-                    variant="ghost",
-                    width="25rem",
+    @rx.memo
+    def accordion_box():
+        return rx.box(
+            rx.accordion.root(
+                rx.accordion.item(
+                    header="Full Ingredients",  # type: ignore
+                    content="Yes. It's built with accessibility in mind.",  # type: ignore
+                    font_size="3em",
+                ),
+                rx.accordion.item(
+                    header="Applications",  # type: ignore
+                    content="Yes. It's unstyled by default, giving you freedom over the look and feel.",  # type: ignore
                 ),
-                padding_top="20px",
+                collapsible=True,
+                variant="ghost",
+                width="25rem",
             ),
-            rx.box(
-                rx.drawer.root(
-                    rx.drawer.trigger(
-                        rx.button("Open Drawer with snap points"), as_child=True
-                    ),
-                    rx.drawer.overlay(),
-                    rx.drawer.portal(
-                        rx.drawer.content(
-                            rx.flex(
-                                rx.drawer.title("Drawer Content"),
-                                rx.drawer.description("Drawer description"),
-                                rx.drawer.close(
-                                    rx.button("Close Button"),
-                                    as_child=True,
-                                ),
-                                direction="column",
-                                margin="5em",
-                                align_items="center",
+            padding_top="20px",
+        )
+
+    @rx.memo
+    def drawer_box():
+        return rx.box(
+            rx.drawer.root(
+                rx.drawer.trigger(
+                    rx.button("Open Drawer with snap points"), as_child=True
+                ),
+                rx.drawer.overlay(),
+                rx.drawer.portal(
+                    rx.drawer.content(
+                        rx.flex(
+                            rx.drawer.title("Drawer Content"),
+                            rx.drawer.description("Drawer description"),
+                            rx.drawer.close(
+                                rx.button("Close Button"),
+                                as_child=True,
                             ),
-                            top="auto",
-                            height="100%",
-                            flex_direction="column",
-                            background_color="var(--green-3)",
+                            direction="column",
+                            margin="5em",
+                            align_items="center",
                         ),
+                        top="auto",
+                        height="100%",
+                        flex_direction="column",
+                        background_color="var(--green-3)",
                     ),
-                    snap_points=["148px", "355px", 1],
                 ),
+                snap_points=["148px", "355px", 1],
             ),
-            rx.box(
-                rx.callout(
-                    "You will need admin privileges to install and access this application.",
-                    icon="info",
-                    size="3",
-                ),
+        )
+
+    @rx.memo
+    def callout_box():
+        return rx.box(
+            rx.callout(
+                "You will need admin privileges to install and access this application.",
+                icon="info",
+                size="3",
             ),
-            rx.box(
-                rx.table.root(
-                    rx.table.header(
-                        rx.table.row(
-                            rx.table.column_header_cell("Full name"),
-                            rx.table.column_header_cell("Email"),
-                            rx.table.column_header_cell("Group"),
-                        ),
+        )
+
+    @rx.memo
+    def table_box():
+        return rx.box(
+            rx.table.root(
+                rx.table.header(
+                    rx.table.row(
+                        rx.table.column_header_cell("Full name"),
+                        rx.table.column_header_cell("Email"),
+                        rx.table.column_header_cell("Group"),
                     ),
-                    rx.table.body(
-                        rx.table.row(
-                            rx.table.row_header_cell("Danilo Sousa"),
-                            rx.table.cell("danilo@example.com"),
-                            rx.table.cell("Developer"),
-                        ),
-                        rx.table.row(
-                            rx.table.row_header_cell("Zahra Ambessa"),
-                            rx.table.cell("zahra@example.com"),
-                            rx.table.cell("Admin"),
-                        ),
-                        rx.table.row(
-                            rx.table.row_header_cell("Jasper Eriksson"),
-                            rx.table.cell("jasper@example.com"),
-                            rx.table.cell("Developer"),
-                        ),
+                ),
+                rx.table.body(
+                    rx.table.row(
+                        rx.table.row_header_cell("Danilo Sousa"),
+                        rx.table.cell("danilo@example.com"),
+                        rx.table.cell("Developer"),
                     ),
-                )
-            ),
+                    rx.table.row(
+                        rx.table.row_header_cell("Zahra Ambessa"),
+                        rx.table.cell("zahra@example.com"),
+                        rx.table.cell("Admin"),
+                    ),
+                    rx.table.row(
+                        rx.table.row_header_cell("Jasper Eriksson"),
+                        rx.table.cell("jasper@example.com"),
+                        rx.table.cell("Developer"),
+                    ),
+                ),
+            )
         )
-    ] * num
+
+    def _build_fragment():
+        return rx.fragment(
+            accordion_box(),
+            drawer_box(),
+            callout_box(),
+            table_box(),
+        )
+
+    fragment_box = rx.memo(_build_fragment)
+
+    return [fragment_box() for _ in range(num)]
 
 
 def AppWithTenComponentsOnePage():
@@ -145,6 +175,171 @@ def AppWithThousandComponentsOnePage():
     app.add_page(index)
 
 
+def _initialize_app_once(harness: AppHarness):
+    """Initialize the harness app, unless an earlier round already did.
+
+    Args:
+        harness: The app harness.
+    """
+    if harness.app_instance is None:
+        harness._initialize_app()
+
+
+@functools.lru_cache(maxsize=8)
+def _setup_frontend_once(app_path_str: str):
+    """Set up the frontend of an app once per path in this session.
+
+    Args:
+        app_path_str: The app directory.
+    """
+    build.setup_frontend(Path(app_path_str))
+
+
+# The harness whose app the parallel round workers compile (inherited on fork).
+_parallel_harness: AppHarness | None = None
+
+
+def _can_report_parallel_rounds() -> bool:
+    """Check whether the installed pytest-benchmark takes externally timed rounds.
+
+    The parallel rounds feed their durations through the private stats API of
+    pytest-benchmark, which is only known to work on the 4.0 series.
+
+    Returns:
+        Whether the parallel rounds can be reported.
+    """
+    return importlib.metadata.version("pytest-benchmark").startswith("4.0.")
+
+
+def _clear_subtree_cache(app_path: Path):
+    """Drop the rendered subtrees cached in memory and on disk for an app.
+
+    Args:
+        app_path: The app directory.
+    """
+    subtree_cache.clear()
+    shutil.rmtree(app_path / constants.Dirs.SUBTREE_CACHE, ignore_errors=True)
+
+
+def _init_round_worker():
+    """Prepare a round worker process to compile alongside the other rounds.
+
+    The rounds share the installed node_modules, so the workers skip installing
+    the frontend packages instead of running concurrent installs into it. Pool
+    workers are daemonic and cannot start the process pools of a parallel
+    compile, so the workers compile with the thread executor and without
+    prerendering subtrees.
+    """
+    prerequisites.install_frontend_packages = lambda *args, **kwargs: None
+    os.environ.pop("REFLEX_COMPILE_PROCESSES", None)
+    os.environ.pop(constants.PARALLEL_COMPILE_ENV_VAR, None)
+
+
+def _compile_round(round_path: Path) -> float:
+    """Compile the harness app from a copy of its directory and time it.
+
+    Args:
+        round_path: The copy of the app directory to compile in.
+
+    Returns:
+        The compile time in seconds.
+    """
+    assert _parallel_harness is not None and _parallel_harness.app_instance
+    with chdir(round_path):
+        utils.empty_dir(constants.Dirs.WEB_PAGES, keep_files=["_app.js"])
+        # The forked worker inherits the subtrees rendered by the parent.
+        subtree_cache.clear()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            _parallel_harness.app_instance._compile()
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
+
+
+def _copy_app_dir(app_path: Path, round_path: Path):
+    """Copy an app directory for one round, sharing the installed node_modules.
+
+    The subtree cache is left out so the round compiles cold.
+
+    Args:
+        app_path: The app directory.
+        round_path: The directory to copy to.
+    """
+    node_modules = Path(constants.Dirs.WEB) / constants.Next.NODE_MODULES
+    skipped = {app_path / node_modules, app_path / constants.Dirs.SUBTREE_CACHE}
+
+    def ignore(directory: str, names: List[str]) -> List[str]:
+        return [name for name in names if Path(directory) / name in skipped]
+
+    shutil.copytree(app_path, round_path, symlinks=True, ignore=ignore)
+    if (app_path / node_modules).exists():
+        (round_path / node_modules).symlink_to(app_path / node_modules)
+
+
+def _pedantic_parallel(
+    benchmark,
+    harness: AppHarness,
+    setup: Callable[[], None],
+    tmp_path_factory,
+    rounds: int,
+):
+    """Run cold compile rounds in worker processes and report them to pytest-benchmark.
+
+    The rounds are independent, so each one compiles in its own copy of the app
+    directory, with up to one worker per CPU. Concurrent rounds compete for CPU
+    and memory bandwidth, so their times can be higher than sequential ones;
+    compare the min column across runs. The parallel rounds do not install the
+    frontend packages and always compile with threads, see _init_round_worker. When the installed pytest-benchmark
+    cannot take externally timed rounds, they run sequentially through
+    benchmark.pedantic instead.
+
+    Args:
+        benchmark: The benchmark fixture.
+        harness: The app harness.
+        setup: Prepares the harness app before the rounds are copied.
+        tmp_path_factory: pytest tmp_path_factory fixture.
+        rounds: The number of rounds to run.
+    """
+    global _parallel_harness
+
+    if benchmark.disabled or not _can_report_parallel_rounds():
+
+        def round_setup():
+            setup()
+            _clear_subtree_cache(harness.app_path)
+
+        def benchmark_fn():
+            with chdir(harness.app_path):
+                harness.app_instance._compile()  # type: ignore
+
+        benchmark.pedantic(benchmark_fn, setup=round_setup, rounds=rounds)
+        return
+
+    setup()
+    rounds_root = tmp_path_factory.mktemp(f"{harness.app_path.name}_rounds")
+    round_paths = [rounds_root / f"round{i}" for i in range(rounds)]
+    for round_path in round_paths:
+        _copy_app_dir(harness.app_path, round_path)
+
+    _parallel_harness = harness
+    try:
+        with multiprocessing.get_context("fork").Pool(
+            processes=min(rounds, os.cpu_count() or 1),
+            initializer=_init_round_worker,
+        ) as pool:
+            times = pool.map(_compile_round, round_paths)
+    finally:
+        _parallel_harness = None
+
+    benchmark._mode = "benchmark.pedantic(...)"
+    stats = benchmark._make_stats(1)
+    for duration in times:
+        stats.update(duration)
+    benchmark.extra_info["min_round_time"] = min(times)
+
+
 @pytest.fixture(scope="session")
 def app_with_10_components(
     tmp_path_factory,
@@ -221,25 +416,24 @@ def app_with_1000_components(
     disable_gc=True,
     warmup=False,
 )
-def test_app_10_compile_time_cold(benchmark, app_with_10_components):
+def test_app_10_compile_time_cold(benchmark, app_with_10_components, tmp_path_factory):
     """Test the compile time on a cold start for an app with roughly 10 components.
 
     Args:
         benchmark: The benchmark fixture.
         app_with_10_components: The app harness.
+        tmp_path_factory: pytest tmp_path_factory fixture
     """
 
     def setup():
         with chdir(app_with_10_components.app_path):
             utils.empty_dir(constants.Dirs.WEB_PAGES, keep_files=["_app.js"])
-            app_with_10_components._initialize_app()
-            build.setup_frontend(app_with_10_components.app_path)
-
-    def benchmark_fn():
-        with chdir(app_with_10_components.app_path):
-            app_with_10_components.app_instance._compile()
+            _initialize_app_once(app_with_10_components)
+            _setup_frontend_once(str(app_with_10_components.app_path))
 
-    benchmark.pedantic(benchmark_fn, setup=setup, rounds=10)
+    _pedantic_parallel(
+        benchmark, app_with_10_components, setup, tmp_path_factory, rounds=10
+    )
 
 
 @pytest.mark.benchmark(
@@ -274,25 +468,26 @@ def test_app_10_compile_time_warm(benchmark, app_with_10_components):
     disable_gc=True,
     warmup=False,
 )
-def test_app_100_compile_time_cold(benchmark, app_with_100_components):
+def test_app_100_compile_time_cold(
+    benchmark, app_with_100_components, tmp_path_factory
+):
     """Test the compile time on a cold start for an app with roughly 100 components.
 
     Args:
         benchmark: The benchmark fixture.
         app_with_100_components: The app harness.
+        tmp_path_factory: pytest tmp_path_factory fixture
     """
 
     def setup():
         with chdir(app_with_100_components.app_path):
             utils.empty_dir(constants.Dirs.WEB_PAGES, keep_files=["_app.js"])
-            app_with_100_components._initialize_app()
-            build.setup_frontend(app_with_100_components.app_path)
-
-    def benchmark_fn():
-        with chdir(app_with_100_components.app_path):
-            app_with_100_components.app_instance._compile()
+            _initialize_app_once(app_with_100_components)
+            _setup_frontend_once(str(app_with_100_components.app_path))
 
-    benchmark.pedantic(benchmark_fn, setup=setup, rounds=5)
+    _pedantic_parallel(
+        benchmark, app_with_100_components, setup, tmp_path_factory, rounds=5
+    )
 
 
 @pytest.mark.benchmark(
@@ -327,25 +522,26 @@ def test_app_100_compile_time_warm(benchmark, app_with_100_components):
     disable_gc=True,
     warmup=False,
 )
-def test_app_1000_compile_time_cold(benchmark, app_with_1000_components):
+def test_app_1000_compile_time_cold(
+    benchmark, app_with_1000_components, tmp_path_factory
+):
     """Test the compile time on a cold start for an app with roughly 1000 components.
 
     Args:
         benchmark: The benchmark fixture.
         app_with_1000_components: The app harness.
+        tmp_path_factory: pytest tmp_path_factory fixture
     """
 
     def setup():
         with chdir(app_with_1000_components.app_path):
             utils.empty_dir(constants.Dirs.WEB_PAGES, keep_files=["_app.js"])
-            app_with_1000_components._initialize_app()
-            build.setup_frontend(app_with_1000_components.app_path)
-
-    def benchmark_fn():
-        with chdir(app_with_1000_components.app_path):
-            app_with_1000_components.app_instance._compile()
+            _initialize_app_once(app_with_1000_components)
+            _setup_frontend_once(str(app_with_1000_components.app_path))
 
-    benchmark.pedantic(benchmark_fn, setup=setup, rounds=5)
+    _pedantic_parallel(
+        benchmark, app_with_1000_components, setup, tmp_path_factory, rounds=5
+    )
 
 
 @pytest.mark.benchmark(
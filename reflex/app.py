@@ -38,6 +38,7 @@ from starlette_admin.contrib.sqla.view import ModelView
 from reflex import constants
 from reflex.admin import AdminDash
 from reflex.base import Base
+from reflex.compiler import _subtree_cache as subtree_cache
 from reflex.compiler import compiler
 from reflex.compiler import utils as compiler_utils
 from reflex.compiler.compiler import ExecutorSafeFunctions
@@ -871,6 +872,10 @@ class App(Base):
 
         progress.advance(task)
 
+        # Render independent sibling subtrees in parallel before the pages are compiled.
+        if os.environ.get(constants.PARALLEL_COMPILE_ENV_VAR) == "1":
+            compiler.prerender_sibling_subtrees(page_components)
+
         # Prepopulate the global ExecutorSafeFunctions class with input data required by the compile functions.
         # This is required for multiprocessing to work, in presence of non-picklable inputs.
         for route, component in zip(self.pages, page_components):
@@ -981,6 +986,9 @@ class App(Base):
         for output_path, code in compile_results:
             compiler_utils.write_page(output_path, code)
 
+        # Persist the rendered subtrees so the next compile starts warm.
+        subtree_cache.save()
+
     @contextlib.asynccontextmanager
     async def modify_state(self, token: str) -> AsyncIterator[BaseState]:
         """Modify the state out of band.
@@ -0,0 +1,231 @@
+"""Content-addressed cache of rendered component subtrees.
+
+Structurally identical component subtrees always render to the same dict, so the
+render output is stored under a digest of everything that affects rendering (see
+`Component._content_hash`). Entries are kept in memory for the life of the
+process and persisted to disk after each compile so later runs start warm.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib
+import os
+import pickle
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from reflex import constants
+
+# Drop the in-memory layer when it grows past this many entries.
+MAX_ENTRIES = 50_000
+
+# The rendered subtrees, keyed by content hash.
+_entries: Dict[bytes, Dict] = {}
+
+# Whether the on-disk cache has been read into memory.
+_loaded = False
+
+# Whether there are entries that have not been written to disk yet.
+_dirty = False
+
+_load_lock = threading.Lock()
+
+# Per-thread memo of content hashes computed during the current render pass.
+_local = threading.local()
+
+
+def _get_cache_file() -> Path:
+    """Get the path of the on-disk cache file.
+
+    Returns:
+        The path to the pickle file.
+    """
+    return Path.cwd() / constants.Dirs.SUBTREE_CACHE / "subtrees.pkl"
+
+
+# The reflex modules whose code shapes the render output of every component.
+_RENDER_MODULES = (
+    "reflex.components.component",
+    "reflex.components.tags.cond_tag",
+    "reflex.components.tags.iter_tag",
+    "reflex.components.tags.match_tag",
+    "reflex.components.tags.tag",
+    "reflex.components.tags.tagless",
+    "reflex.style",
+    "reflex.utils.format",
+    "reflex.utils.serializers",
+    "reflex.vars",
+)
+
+
+@lru_cache(maxsize=None)
+def _get_module_mtime(module_name: str) -> Optional[int]:
+    """Get the modification time of the source file of a module.
+
+    Args:
+        module_name: The name of the module.
+
+    Returns:
+        The mtime in nanoseconds, or None if the module has no source file.
+    """
+    module = sys.modules.get(module_name)
+    source_file = getattr(module, "__file__", None)
+    try:
+        return os.stat(source_file).st_mtime_ns if source_file else None
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _get_render_code_hash() -> str:
+    """Get a digest of the reflex sources shared by all component renders.
+
+    Returns:
+        The hex digest of the sources in _RENDER_MODULES.
+    """
+    digest = hashlib.sha256()
+    for module_name in _RENDER_MODULES:
+        source_file = getattr(importlib.import_module(module_name), "__file__", None)
+        if source_file:
+            digest.update(Path(source_file).read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_class_salt(cls: type) -> str:
+    """Get the part of the cache key that depends on the code rendering a class.
+
+    Args:
+        cls: The component class.
+
+    Returns:
+        A string identifying the reflex version, python version, the shared render
+        code and the sources of every class in the MRO.
+    """
+    module_names = dict.fromkeys(base.__module__ for base in cls.__mro__)
+    module_mtimes = ",".join(
+        f"{module_name}:{_get_module_mtime(module_name)}"
+        for module_name in module_names
+    )
+    return (
+        f"{constants.Reflex.VERSION}|{sys.version}|{_get_render_code_hash()}|"
+        f"{cls.__module__}.{cls.__qualname__}|{module_mtimes}"
+    )
+
+
+def get_hash_memo() -> Optional[Dict[int, Tuple[Any, Optional[bytes]]]]:
+    """Get the content hash memo for the active render pass.
+
+    Returns:
+        A dict mapping id(component) to (component, hash), or None outside a pass.
+    """
+    return getattr(_local, "memo", None)
+
+
+@contextlib.contextmanager
+def render_pass() -> Iterator[None]:
+    """Memoize content hashes for the duration of the outermost render call.
+
+    Components are mutable, so hashes are only reused while a single tree is
+    being rendered.
+
+    Yields:
+        None
+    """
+    if get_hash_memo() is not None:
+        yield
+        return
+    _local.memo = {}
+    try:
+        yield
+    finally:
+        _local.memo = None
+
+
+def load():
+    """Read the on-disk cache into memory (once per process)."""
+    global _loaded
+    with _load_lock:
+        if _loaded:
+            return
+        _loaded = True
+        cache_file = _get_cache_file()
+        if not cache_file.exists():
+            return
+        try:
+            with cache_file.open("rb") as f:
+                entries = pickle.load(f)
+        except Exception:
+            # A stale or corrupt cache is simply ignored.
+            return
+        if isinstance(entries, dict):
+            for key, rendered in entries.items():
+                _entries.setdefault(key, rendered)
+
+
+def get(key: bytes) -> Optional[Dict]:
+    """Get a rendered subtree from the cache.
+
+    Args:
+        key: The content hash of the component.
+
+    Returns:
+        The cached render dict, or None on a miss.
+    """
+    if not _loaded:
+        load()
+    return _entries.get(key)
+
+
+def put(key: bytes, rendered: Dict):
+    """Store a rendered subtree in the cache.
+
+    The dict is shared between all callers, so it must not be mutated afterwards.
+
+    Args:
+        key: The content hash of the component.
+        rendered: The render dict of the component.
+    """
+    global _dirty
+    if len(_entries) >= MAX_ENTRIES:
+        _entries.clear()
+    _entries[key] = rendered
+    _dirty = True
+
+
+def save():
+    """Write the in-memory cache to disk, skipping entries that cannot be pickled."""
+    global _dirty
+    if not _dirty:
+        return
+    entries = dict(_entries)
+    try:
+        data = pickle.dumps(entries)
+    except Exception:
+        picklable = {}
+        for key, rendered in entries.items():
+            try:
+                pickle.dumps(rendered)
+            except Exception:
+                continue
+            picklable[key] = rendered
+        data = pickle.dumps(picklable)
+    cache_file = _get_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(data)
+    except OSError:
+        return
+    _dirty = False
+
+
+def clear():
+    """Drop all in-memory entries (the on-disk cache is left untouched)."""
+    global _dirty
+    _entries.clear()
+    _dirty = False
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import multiprocessing
 import os
+import platform
 from pathlib import Path
 from typing import Dict, Iterable, Optional, Type, Union
 
 from reflex import constants
+from reflex.compiler import _subtree_cache as subtree_cache
 from reflex.compiler import templates, utils
 from reflex.components.component import (
     BaseComponent,
@@ -18,6 +22,7 @@ from reflex.components.component import (
 from reflex.config import get_config
 from reflex.state import BaseState
 from reflex.style import LIGHT_COLOR_MODE
+from reflex.utils import console
 from reflex.utils.exec import is_prod_mode
 from reflex.utils.imports import ImportVar
 from reflex.vars import Var
@@ -495,6 +500,76 @@ def remove_tailwind_from_postcss() -> tuple[str, str]:
     return output_path, "".join(code)
 
 
+def _get_sibling_subtrees(component: BaseComponent) -> list[BaseComponent]:
+    """Get the first set of sibling subtrees below single-child wrappers.
+
+    Args:
+        component: The page component.
+
+    Returns:
+        The children of the first component with more than one child.
+    """
+    while len(component.children) == 1:
+        component = component.children[0]
+    return component.children
+
+
+def prerender_sibling_subtrees(page_components: Iterable[BaseComponent]):
+    """Render the independent sibling subtrees of each page in parallel processes.
+
+    Siblings do not depend on each other, so each unique subtree is rendered in a
+    forked worker and the result is stored in the subtree cache. The page render
+    that follows then only has to stitch the cached subtrees together.
+
+    Subtrees whose render output cannot be sent back from the worker, or all of
+    them if the process pool cannot run, are skipped and rendered normally with
+    the rest of the page.
+
+    Args:
+        page_components: The Components or StatefulComponents of each page.
+    """
+    if platform.system() not in ("Linux", "Darwin"):
+        return
+
+    # Assign each unique uncached subtree to a worker.
+    subtrees: dict[bytes, Component] = {}
+    with subtree_cache.render_pass():
+        for page_component in page_components:
+            for child in _get_sibling_subtrees(page_component):
+                if not isinstance(child, Component):
+                    continue
+                key = child._content_hash()
+                if key is None or key in subtrees or subtree_cache.get(key) is not None:
+                    continue
+                subtrees[key] = child
+    if len(subtrees) < 2:
+        return
+
+    ExecutorSafeFunctions.PRERENDER_SUBTREES = list(subtrees.values())
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=int(os.environ.get("REFLEX_COMPILE_PROCESSES", 0)) or None,
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            futures = [
+                executor.submit(ExecutorSafeFunctions.render_subtree, index)
+                for index in range(len(subtrees))
+            ]
+            # Collect the rendered subtrees in their original order.
+            for key, future in zip(subtrees, futures):
+                try:
+                    rendered = future.result()
+                except Exception:
+                    continue
+                subtree_cache.put(key, rendered)
+    except Exception as e:
+        # The pool could not run, e.g. in a daemonic process or after a worker
+        # died. The subtrees are then rendered serially with their page.
+        console.debug(f"Skipping the parallel prerender of subtrees: {e!r}")
+    finally:
+        ExecutorSafeFunctions.PRERENDER_SUBTREES = []
+
+
 def purge_web_pages_dir():
     """Empty out .web/pages directory."""
     if not is_prod_mode() and os.environ.get("REFLEX_PERSIST_WEB_DIR"):
@@ -534,6 +609,7 @@ class ExecutorSafeFunctions:
     COMPILE_APP_APP_ROOT: Component | None = None
     CUSTOM_COMPONENTS: set[CustomComponent] | None = None
     STYLE: ComponentStyle | None = None
+    PRERENDER_SUBTREES: list[Component] = []
 
     @classmethod
     def compile_page(cls, route: str):
@@ -547,6 +623,18 @@ class ExecutorSafeFunctions:
         """
         return compile_page(*cls.COMPILE_PAGE_ARGS_BY_ROUTE[route])
 
+    @classmethod
+    def render_subtree(cls, index: int) -> dict:
+        """Render a sibling subtree of a page.
+
+        Args:
+            index: The index of the subtree in PRERENDER_SUBTREES.
+
+        Returns:
+            The render dict of the subtree.
+        """
+        return cls.PRERENDER_SUBTREES[index].render()
+
     @classmethod
     def compile_app(cls):
         """Compile the app.
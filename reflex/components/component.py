@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import copy
+import dataclasses
+import hashlib
 import typing
 from abc import ABC, abstractmethod
 from functools import lru_cache, wraps
@@ -17,12 +19,14 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     Union,
 )
 
 import reflex.state
 from reflex.base import Base
+from reflex.compiler import _subtree_cache as subtree_cache
 from reflex.compiler.templates import STATEFUL_COMPONENT
 from reflex.components.tags import Tag
 from reflex.constants import (
@@ -34,6 +38,7 @@ from reflex.constants import (
     MemoizationMode,
     PageNames,
 )
+from reflex.constants.colors import Color
 from reflex.event import (
     EventChain,
     EventHandler,
@@ -70,6 +75,9 @@ class BaseComponent(Base, ABC):
     # The tag to use when rendering the component.
     tag: Optional[str] = None
 
+    # Fields that do not affect the render output, left out of the content hash.
+    _content_hash_exclude: ClassVar[Set[str]] = set()
+
     @abstractmethod
     def render(self) -> dict:
         """Render the component.
@@ -126,6 +134,212 @@ class BaseComponent(Base, ABC):
             The refs for the children.
         """
 
+    def _content_hash(self) -> bytes | None:
+        """Get a digest of everything that affects how this component renders.
+
+        Structurally identical subtrees share a digest, which keys the rendered
+        subtree cache. Inside a render pass the digest is memoized per instance.
+
+        Returns:
+            The sha256 digest, or None if some value has no stable representation.
+        """
+        memo = subtree_cache.get_hash_memo()
+        if memo is not None and (entry := memo.get(id(self))) is not None:
+            return entry[1]
+
+        recipe = [subtree_cache.get_class_salt(type(self))]
+        defaults = _get_field_defaults(type(self))
+        digest = None
+        for name, value in self.__dict__.items():
+            default = defaults.get(name, _NO_DEFAULT)
+            if (
+                value is default
+                or default is _EXCLUDED
+                or (type(value) is type(default) and _is_default(value, default))
+            ):
+                continue
+            value_repr = _content_repr(value)
+            if value_repr is None:
+                break
+            recipe.append(f"{name}={value_repr}")
+        else:
+            digest = hashlib.sha256("\n".join(recipe).encode("utf-8")).digest()
+
+        if memo is not None:
+            # Keep a reference so the id cannot be reused during the pass.
+            memo[id(self)] = (self, digest)
+        return digest
+
+
+def _iter_children_postorder(root: BaseComponent) -> Iterator[BaseComponent]:
+    """Iterate over a component tree, children before their parents.
+
+    Args:
+        root: The root of the tree.
+
+    Yields:
+        Each component in the tree, ending with the root.
+    """
+    stack = [(root, iter(getattr(root, "children", [])))]
+    while stack:
+        component, pending = stack[-1]
+        for child in pending:
+            if isinstance(child, BaseComponent):
+                stack.append((child, iter(getattr(child, "children", []))))
+                break
+        else:
+            stack.pop()
+            yield component
+
+
+# Marks fields without a default value.
+_NO_DEFAULT = object()
+
+# Values of these types are identified by their repr.
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# The dataclass fields of a BaseVar, in declaration order.
+_BASE_VAR_FIELDS = tuple(field.name for field in dataclasses.fields(BaseVar))
+
+
+# Marks fields left out of the content hash.
+_EXCLUDED = object()
+
+
+@lru_cache(maxsize=None)
+def _get_field_defaults(cls: Type[BaseComponent]) -> Dict[str, Any]:
+    """Get the default values of the fields of a component class.
+
+    Args:
+        cls: The component class.
+
+    Returns:
+        A mapping of field name to default value, for fields that have one, or
+        to _EXCLUDED for the fields in _content_hash_exclude.
+    """
+    defaults = {
+        name: field.default
+        for name, field in cls.__fields__.items()
+        if not field.required
+    }
+    defaults.update(dict.fromkeys(cls._content_hash_exclude, _EXCLUDED))
+    return defaults
+
+
+def _is_default(value: Any, default: Any) -> bool:
+    """Check whether a field value is known to equal its default.
+
+    Defaults are part of the class code, which the cache salt covers, so these
+    fields can be left out of the content hash.
+
+    Args:
+        value: The field value.
+        default: The default value of the field.
+
+    Returns:
+        Whether the value is the default.
+    """
+    if value is default:
+        return True
+    value_type = type(value)
+    if value_type is not type(default):
+        return False
+    if value_type in _SCALAR_TYPES:
+        return value == default
+    # Mutable defaults are copied per instance; only empty ones are compared,
+    # since Var overloads == and cannot be compared by value.
+    return (
+        value_type in (list, dict, tuple, set, Style)
+        and not value
+        and not default
+        and getattr(value, "_var_data", None) is None
+    )
+
+
+def _type_repr(type_: Any) -> str | None:
+    """Get a stable string representation of a type annotation.
+
+    Args:
+        type_: The type.
+
+    Returns:
+        The representation, or None if the type has no stable representation.
+    """
+    if isinstance(type_, type):
+        return f"{type_.__module__}.{type_.__qualname__}"
+    if getattr(type_, "__module__", None) == "typing":
+        return repr(type_)
+    return None
+
+
+def _content_repr(value: Any) -> str | None:
+    """Get a stable string representation of a component field value.
+
+    Only values whose representation is known to capture everything rendered
+    from them are supported; anything else makes the component uncacheable.
+
+    Args:
+        value: The field value.
+
+    Returns:
+        The representation, or None if the value has no stable representation.
+    """
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return repr(value)
+    if isinstance(value, BaseComponent):
+        digest = value._content_hash()
+        return None if digest is None else digest.hex()
+    if value_type is BaseVar:
+        parts = []
+        for name in _BASE_VAR_FIELDS:
+            # Bypass Var.__getattribute__, only plain fields are read here.
+            field_value = object.__getattribute__(value, name)
+            field_repr = (
+                _type_repr(field_value)
+                if name == "_var_type"
+                else _content_repr(field_value)
+            )
+            if field_repr is None:
+                return None
+            parts.append(field_repr)
+        return f"Var({', '.join(parts)})"
+    if value_type in (list, tuple):
+        parts = []
+        for item in value:
+            item_repr = _content_repr(item)
+            if item_repr is None:
+                return None
+            parts.append(item_repr)
+        return f"{value_type.__name__}[{', '.join(parts)}]"
+    if value_type in (set, frozenset):
+        # Sort the items, set iteration order varies between processes.
+        parts = []
+        for item in value:
+            item_repr = _content_repr(item)
+            if item_repr is None:
+                return None
+            parts.append(item_repr)
+        return f"{value_type.__name__}{{{', '.join(sorted(parts))}}}"
+    if value_type in (dict, Style):
+        parts = []
+        for key, item in value.items():
+            item_repr = _content_repr(item)
+            if type(key) not in _SCALAR_TYPES or item_repr is None:
+                return None
+            parts.append(f"{key!r}: {item_repr}")
+        var_data_repr = _content_repr(getattr(value, "_var_data", None))
+        if var_data_repr is None:
+            return None
+        return f"{value_type.__name__}{{{', '.join(parts)}}}|{var_data_repr}"
+    if value_type is Color:
+        return repr(value)
+    if value_type in (VarData, ImportVar):
+        return _content_repr(
+            {name: getattr(value, name) for name in value_type.__fields__}
+        )
+    return None
+
 
 class ComponentNamespace(SimpleNamespace):
     """A namespace to manage components with subcomponents."""
@@ -650,10 +864,11 @@ class Component(BaseComponent, ABC):
         )
 
         if props is None:
-            # Add component props to the tag.
+            # Add component props to the tag, skipping the unset ones.
             props = {
-                attr[:-1] if attr.endswith("_") else attr: getattr(self, attr)
-                for attr in self.get_props()
+                prop_name: value
+                for attr, prop_name in self._get_prop_names()
+                if (value := getattr(self, attr)) is not None
             }
 
             # Add ref to element if `id` is not None.
@@ -692,6 +907,19 @@ class Component(BaseComponent, ABC):
         """
         return set(cls.get_fields()) - set(Component.get_fields())
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_prop_names(cls) -> Tuple[Tuple[str, str], ...]:
+        """Get the field names of the props with the names they render as.
+
+        Returns:
+            Pairs of (field name, prop name), with any trailing underscore stripped.
+        """
+        return tuple(
+            (attr, attr[:-1] if attr.endswith("_") else attr)
+            for attr in sorted(cls.get_props())
+        )
+
     @classmethod
     @lru_cache(maxsize=None)
     def get_initial_props(cls) -> Set[str]:
@@ -906,20 +1134,69 @@ class Component(BaseComponent, ABC):
     def render(self) -> Dict:
         """Render the component.
 
+        Structurally identical subtrees are only rendered once, the result is
+        shared through the subtree cache. Descendants that use this render
+        method are walked with an explicit stack instead of recursion, so deep
+        trees do not hit the recursion limit.
+
         Returns:
             The dictionary for template of component.
         """
-        tag = self._render()
-        rendered_dict = dict(
-            tag.set(
-                children=[child.render() for child in self.children],
-                contents=str(tag.contents),
-                props=tag.format_props(),
-            ),
-            autofocus=self.autofocus,
-        )
-        self._replace_prop_names(rendered_dict)
-        return rendered_dict
+        with subtree_cache.render_pass():
+            rendered: List[Dict] = []
+            # Frames of (component, tag, cache key, rendered children,
+            # children left to visit, list to append the result to).
+            stack = []
+
+            def visit(component: BaseComponent, out: List[Dict], is_root=False):
+                # Components with their own render method render their subtree.
+                if not is_root and type(component).render is not Component.render:
+                    out.append(component.render())
+                    return
+                key = component._content_hash()
+                if key is not None:
+                    rendered_dict = subtree_cache.get(key)
+                    if rendered_dict is not None:
+                        out.append(rendered_dict)
+                        return
+                stack.append(
+                    (
+                        component,
+                        component._render(),  # type: ignore
+                        key,
+                        [],
+                        iter(component.children),
+                        out,
+                    )
+                )
+
+            # Hash the tree bottom-up, so each digest only looks up the memoized
+            # digests of its children instead of recursing into them.
+            for component in _iter_children_postorder(self):
+                component._content_hash()
+
+            visit(self, rendered, is_root=True)
+            while stack:
+                component, tag, key, children, pending, out = stack[-1]
+                for child in pending:
+                    visit(child, children)
+                    break
+                else:
+                    stack.pop()
+                    rendered_dict = dict(
+                        tag.set(
+                            children=children,
+                            contents=str(tag.contents),
+                            props=tag.format_props(),
+                        ),
+                        autofocus=component.autofocus,
+                    )
+                    component._replace_prop_names(rendered_dict)
+
+                    if key is not None:
+                        subtree_cache.put(key, rendered_dict)
+                    out.append(rendered_dict)
+            return rendered[0]
 
     def _replace_prop_names(self, rendered_dict) -> None:
         """Replace the prop names in the render dictionary.
@@ -1613,6 +1890,10 @@ class CustomComponent(Component):
     # Props that reference other components.
     component_props: Dict[str, Component] = {}
 
+    # Only the tag derived from the function is rendered, not the function itself
+    # (or the cached get_component method, which pydantic lists as a field).
+    _content_hash_exclude: ClassVar[Set[str]] = {"component_fn", "get_component"}
+
     def __init__(self, *args, **kwargs):
         """Initialize the custom component.
 
@@ -2209,6 +2490,18 @@ class StatefulComponent(BaseComponent):
         """
         return dict(Tag(name=self.tag))
 
+    def _content_hash(self) -> bytes | None:
+        """Get a digest of everything that affects how this component renders.
+
+        Only the tag is rendered, and it already embeds a hash of the wrapped code.
+
+        Returns:
+            The sha256 digest.
+        """
+        return hashlib.sha256(
+            f"{subtree_cache.get_class_salt(type(self))}|{self.tag}".encode("utf-8")
+        ).digest()
+
     def __str__(self) -> str:
         """Represent the component in React.
 
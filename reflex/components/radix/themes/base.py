@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Literal
+from typing import Any, ClassVar, Dict, Literal, Optional
 
 from reflex.components import Component
 from reflex.components.tags import Tag
@@ -47,6 +47,23 @@ LiteralAccentColor = Literal[
     "gray",
 ]
 
+# Accent colors are a closed set, so their Vars are created once and shared.
+_ACCENT_COLOR_VARS: Dict[str, Var] = {
+    color: Var.create_safe(color) for color in LiteralAccentColor.__args__
+}
+
+# The css prop of every Theme, which spreads the global theme styles.
+_THEME_CSS_VAR = Var.create_safe(
+    "{{...theme.styles.global[':root'], ...theme.styles.global.body}}",
+    _var_is_local=False,
+)
+
+# The imports every Theme adds on top of its component imports.
+_THEME_IMPORTS: imports.ImportDict = {
+    "": [imports.ImportVar(tag="@radix-ui/themes/styles.css", install=False)],
+    "/utils/theme.js": [imports.ImportVar(tag="theme", is_default=True)],
+}
+
 
 class CommonMarginProps(Component):
     """Many radix-themes elements accept shorthand margin props."""
@@ -88,6 +105,24 @@ class RadixThemesComponent(Component):
     # "Fake" prop color_scheme is used to avoid shadowing CSS prop "color".
     _rename_props: Dict[str, str] = {"colorScheme": "color"}
 
+    # The default tag of the class and the alias derived from it.
+    _radix_tag: ClassVar[Optional[str]] = None
+    _radix_alias: ClassVar[str] = "RadixThemesRadixThemesComponent"
+
+    # The color mode provider returned as app wrap component, created on first use.
+    _color_mode_provider: ClassVar[Optional[Component]] = None
+
+    @classmethod
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the alias for instances of the subclass.
+
+        Args:
+            **kwargs: The kwargs to pass to the superclass.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._radix_tag = cls.get_fields()["tag"].default
+        cls._radix_alias = "RadixThemes" + (cls._radix_tag or cls.__name__)
+
     @classmethod
     def create(
         cls,
@@ -109,15 +144,26 @@ class RadixThemesComponent(Component):
         component = super().create(*children, **props)
         if component.library is None:
             component.library = RadixThemesComponent.__fields__["library"].default
-        component.alias = "RadixThemes" + (
-            component.tag or component.__class__.__name__
+        component_cls = type(component)
+        component.alias = (
+            component_cls._radix_alias
+            if component.tag == component_cls._radix_tag
+            else "RadixThemes" + (component.tag or component_cls.__name__)
         )
         return component
 
     @staticmethod
     def _get_app_wrap_components() -> dict[tuple[int, str], Component]:
+        # App wrappers are deep-copied before use, so a single provider is shared.
+        # The dict itself is updated by callers and must be a new one every time.
+        if RadixThemesComponent._color_mode_provider is None:
+            RadixThemesComponent._color_mode_provider = (
+                RadixThemesColorModeProvider.create()
+            )
         return {
-            (45, "RadixThemesColorModeProvider"): RadixThemesColorModeProvider.create(),
+            (45, "RadixThemesColorModeProvider"): (
+                RadixThemesComponent._color_mode_provider
+            ),
         }
 
 
@@ -204,31 +250,19 @@ class Theme(RadixThemesComponent):
         """
         if color_mode is not None:
             props["appearance"] = color_mode
+        accent_color = props.get("accent_color")
+        if isinstance(accent_color, str) and accent_color in _ACCENT_COLOR_VARS:
+            props["accent_color"] = _ACCENT_COLOR_VARS[accent_color]
         if theme_panel:
             children = [ThemePanel.create(), *children]
         return super().create(*children, **props)
 
     def _get_imports(self) -> imports.ImportDict:
-        return imports.merge_imports(
-            super()._get_imports(),
-            {
-                "": [
-                    imports.ImportVar(tag="@radix-ui/themes/styles.css", install=False)
-                ],
-                "/utils/theme.js": [
-                    imports.ImportVar(tag="theme", is_default=True),
-                ],
-            },
-        )
+        return imports.merge_imports(super()._get_imports(), _THEME_IMPORTS)
 
     def _render(self, props: dict[str, Any] | None = None) -> Tag:
         tag = super()._render(props)
-        tag.add_props(
-            css=Var.create(
-                "{{...theme.styles.global[':root'], ...theme.styles.global.body}}",
-                _var_is_local=False,
-            ),
-        )
+        tag.add_props(css=_THEME_CSS_VAR)
         return tag
 
 
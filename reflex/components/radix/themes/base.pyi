@@ -7,7 +7,7 @@ from typing import Any, Dict, Literal, Optional, Union, overload
 from reflex.vars import Var, BaseVar, ComputedVar
 from reflex.event import EventChain, EventHandler, EventSpec
 from reflex.style import Style
-from typing import Any, Dict, Literal
+from typing import Any, ClassVar, Dict, Literal, Optional
 from reflex.components import Component
 from reflex.components.tags import Tag
 from reflex.utils import imports
@@ -50,6 +50,10 @@ LiteralAccentColor = Literal[
     "bronze",
     "gray",
 ]
+_THEME_CSS_VAR = Var.create_safe(
+    "{{...theme.styles.global[':root'], ...theme.styles.global.body}}",
+    _var_is_local=False,
+)
 
 class CommonMarginProps(Component):
     @overload
@@ -255,6 +259,10 @@ class RadixLoadingProp(Component):
         ...
 
 class RadixThemesComponent(Component):
+    _radix_tag: ClassVar[Optional[str]] = None
+    _radix_alias: ClassVar[str] = "RadixThemesRadixThemesComponent"
+    _color_mode_provider: ClassVar[Optional[Component]] = None
+
     @overload
     @classmethod
     def create(  # type: ignore
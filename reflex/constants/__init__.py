@@ -1,120 +1,169 @@
-"""The constants package."""
+"""The constants package.
 
-from .base import (
-    COOKIES,
-    ENV_MODE_ENV_VAR,
-    IS_WINDOWS,
-    LOCAL_STORAGE,
-    POLLING_MAX_HTTP_BUFFER_SIZE,
-    PYTEST_CURRENT_TEST,
-    REFLEX_VAR_CLOSING_TAG,
-    REFLEX_VAR_OPENING_TAG,
-    RELOAD_CONFIG,
-    SKIP_COMPILE_ENV_VAR,
-    ColorMode,
-    Dirs,
-    Env,
-    LogLevel,
-    Next,
-    Ping,
-    Reflex,
-    ReflexHostingCLI,
-    Templates,
-)
-from .compiler import (
-    NOCOMPILE_FILE,
-    SETTER_PREFIX,
-    CompileVars,
-    ComponentName,
-    Ext,
-    Hooks,
-    Imports,
-    MemoizationDisposition,
-    MemoizationMode,
-    PageNames,
-)
-from .config import (
-    ALEMBIC_CONFIG,
-    PRODUCTION_BACKEND_URL,
-    Config,
-    Expiration,
-    GitIgnore,
-    RequirementsTxt,
-)
-from .custom_components import (
-    CustomComponents,
-)
-from .event import Endpoint, EventTriggers, SocketEvent
-from .installer import (
-    Bun,
-    Fnm,
-    Node,
-    PackageJson,
-)
-from .route import (
-    ROUTE_NOT_FOUND,
-    ROUTER,
-    ROUTER_DATA,
-    ROUTER_DATA_INCLUDE,
-    DefaultPage,
-    Page404,
-    RouteArgType,
-    RouteRegex,
-    RouteVar,
-)
-from .style import STYLES_DIR, Tailwind
+Constants are loaded lazily from their submodule on first access.
+"""
 
-__ALL__ = [
-    ALEMBIC_CONFIG,
-    Bun,
-    ColorMode,
-    Config,
-    COOKIES,
-    ComponentName,
-    CustomComponents,
-    DefaultPage,
-    Dirs,
-    Endpoint,
-    Env,
-    EventTriggers,
-    Expiration,
-    Ext,
-    Fnm,
-    REFLEX_VAR_CLOSING_TAG,
-    REFLEX_VAR_OPENING_TAG,
-    GitIgnore,
-    Hooks,
-    Imports,
-    IS_WINDOWS,
-    LOCAL_STORAGE,
-    LogLevel,
-    MemoizationDisposition,
-    MemoizationMode,
-    Next,
-    Node,
-    NOCOMPILE_FILE,
-    PackageJson,
-    PageNames,
-    Page404,
-    Ping,
-    POLLING_MAX_HTTP_BUFFER_SIZE,
-    PYTEST_CURRENT_TEST,
-    PRODUCTION_BACKEND_URL,
-    Reflex,
-    RELOAD_CONFIG,
-    RequirementsTxt,
-    RouteArgType,
-    RouteRegex,
-    RouteVar,
-    ROUTER,
-    ROUTER_DATA,
-    ROUTER_DATA_INCLUDE,
-    ROUTE_NOT_FOUND,
-    SETTER_PREFIX,
-    SKIP_COMPILE_ENV_VAR,
-    SocketEvent,
-    STYLES_DIR,
-    Tailwind,
-    Templates,
-    CompileVars,
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Mapping of submodule to the constants it provides.
+_SUBMODULE_ATTRS: dict[str, list[str]] = {
+    "base": [
+        "COOKIES",
+        "ENV_MODE_ENV_VAR",
+        "IS_WINDOWS",
+        "LOCAL_STORAGE",
+        "PARALLEL_COMPILE_ENV_VAR",
+        "POLLING_MAX_HTTP_BUFFER_SIZE",
+        "PYTEST_CURRENT_TEST",
+        "REFLEX_VAR_CLOSING_TAG",
+        "REFLEX_VAR_OPENING_TAG",
+        "RELOAD_CONFIG",
+        "SKIP_COMPILE_ENV_VAR",
+        "ColorMode",
+        "Dirs",
+        "Env",
+        "LogLevel",
+        "Next",
+        "Ping",
+        "Reflex",
+        "ReflexHostingCLI",
+        "Templates",
+    ],
+    "compiler": [
+        "NOCOMPILE_FILE",
+        "SETTER_PREFIX",
+        "CompileVars",
+        "ComponentName",
+        "Ext",
+        "Hooks",
+        "Imports",
+        "MemoizationDisposition",
+        "MemoizationMode",
+        "PageNames",
+    ],
+    "config": [
+        "ALEMBIC_CONFIG",
+        "PRODUCTION_BACKEND_URL",
+        "Config",
+        "Expiration",
+        "GitIgnore",
+        "RequirementsTxt",
+    ],
+    "custom_components": [
+        "CustomComponents",
+    ],
+    "event": [
+        "Endpoint",
+        "EventTriggers",
+        "SocketEvent",
+    ],
+    "installer": [
+        "Bun",
+        "Fnm",
+        "Node",
+        "PackageJson",
+    ],
+    "route": [
+        "ROUTE_NOT_FOUND",
+        "ROUTER",
+        "ROUTER_DATA",
+        "ROUTER_DATA_INCLUDE",
+        "DefaultPage",
+        "Page404",
+        "RouteArgType",
+        "RouteRegex",
+        "RouteVar",
+    ],
+    "style": [
+        "STYLES_DIR",
+        "Tailwind",
+    ],
+}
+
+__all__ = [
+    "ALEMBIC_CONFIG",
+    "Bun",
+    "COOKIES",
+    "ColorMode",
+    "CompileVars",
+    "ComponentName",
+    "Config",
+    "CustomComponents",
+    "DefaultPage",
+    "Dirs",
+    "ENV_MODE_ENV_VAR",
+    "Endpoint",
+    "Env",
+    "EventTriggers",
+    "Expiration",
+    "Ext",
+    "Fnm",
+    "GitIgnore",
+    "Hooks",
+    "IS_WINDOWS",
+    "Imports",
+    "LOCAL_STORAGE",
+    "LogLevel",
+    "MemoizationDisposition",
+    "MemoizationMode",
+    "NOCOMPILE_FILE",
+    "Next",
+    "Node",
+    "PARALLEL_COMPILE_ENV_VAR",
+    "POLLING_MAX_HTTP_BUFFER_SIZE",
+    "PRODUCTION_BACKEND_URL",
+    "PYTEST_CURRENT_TEST",
+    "PackageJson",
+    "Page404",
+    "PageNames",
+    "Ping",
+    "REFLEX_VAR_CLOSING_TAG",
+    "REFLEX_VAR_OPENING_TAG",
+    "RELOAD_CONFIG",
+    "ROUTER",
+    "ROUTER_DATA",
+    "ROUTER_DATA_INCLUDE",
+    "ROUTE_NOT_FOUND",
+    "Reflex",
+    "ReflexHostingCLI",
+    "RequirementsTxt",
+    "RouteArgType",
+    "RouteRegex",
+    "RouteVar",
+    "SETTER_PREFIX",
+    "SKIP_COMPILE_ENV_VAR",
+    "STYLES_DIR",
+    "SocketEvent",
+    "Tailwind",
+    "Templates",
 ]
+
+_ATTR_TO_SUBMODULE = {
+    attr: submodule for submodule, attrs in _SUBMODULE_ATTRS.items() for attr in attrs
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy load a constant from its submodule.
+
+    Args:
+        name: The name of the constant.
+
+    Returns:
+        The constant, or the submodule if name is one.
+
+    Raises:
+        AttributeError: If the constant does not exist.
+    """
+    if name in _SUBMODULE_ATTRS:
+        return importlib.import_module(f".{name}", __name__)
+    submodule = _ATTR_TO_SUBMODULE.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    # Cache the constant so later lookups do not go through __getattr__.
+    globals()[name] = value
+    return value
@@ -0,0 +1,65 @@
+"""Stub file for reflex/constants/__init__.py"""
+
+from . import base as base
+from . import compiler as compiler
+from . import config as config
+from . import custom_components as custom_components
+from . import event as event
+from . import installer as installer
+from . import route as route
+from . import style as style
+from .base import COOKIES as COOKIES
+from .base import ENV_MODE_ENV_VAR as ENV_MODE_ENV_VAR
+from .base import IS_WINDOWS as IS_WINDOWS
+from .base import LOCAL_STORAGE as LOCAL_STORAGE
+from .base import PARALLEL_COMPILE_ENV_VAR as PARALLEL_COMPILE_ENV_VAR
+from .base import POLLING_MAX_HTTP_BUFFER_SIZE as POLLING_MAX_HTTP_BUFFER_SIZE
+from .base import PYTEST_CURRENT_TEST as PYTEST_CURRENT_TEST
+from .base import REFLEX_VAR_CLOSING_TAG as REFLEX_VAR_CLOSING_TAG
+from .base import REFLEX_VAR_OPENING_TAG as REFLEX_VAR_OPENING_TAG
+from .base import RELOAD_CONFIG as RELOAD_CONFIG
+from .base import SKIP_COMPILE_ENV_VAR as SKIP_COMPILE_ENV_VAR
+from .base import ColorMode as ColorMode
+from .base import Dirs as Dirs
+from .base import Env as Env
+from .base import LogLevel as LogLevel
+from .base import Next as Next
+from .base import Ping as Ping
+from .base import Reflex as Reflex
+from .base import ReflexHostingCLI as ReflexHostingCLI
+from .base import Templates as Templates
+from .compiler import NOCOMPILE_FILE as NOCOMPILE_FILE
+from .compiler import SETTER_PREFIX as SETTER_PREFIX
+from .compiler import CompileVars as CompileVars
+from .compiler import ComponentName as ComponentName
+from .compiler import Ext as Ext
+from .compiler import Hooks as Hooks
+from .compiler import Imports as Imports
+from .compiler import MemoizationDisposition as MemoizationDisposition
+from .compiler import MemoizationMode as MemoizationMode
+from .compiler import PageNames as PageNames
+from .config import ALEMBIC_CONFIG as ALEMBIC_CONFIG
+from .config import PRODUCTION_BACKEND_URL as PRODUCTION_BACKEND_URL
+from .config import Config as Config
+from .config import Expiration as Expiration
+from .config import GitIgnore as GitIgnore
+from .config import RequirementsTxt as RequirementsTxt
+from .custom_components import CustomComponents as CustomComponents
+from .event import Endpoint as Endpoint
+from .event import EventTriggers as EventTriggers
+from .event import SocketEvent as SocketEvent
+from .installer import Bun as Bun
+from .installer import Fnm as Fnm
+from .installer import Node as Node
+from .installer import PackageJson as PackageJson
+from .route import ROUTE_NOT_FOUND as ROUTE_NOT_FOUND
+from .route import ROUTER as ROUTER
+from .route import ROUTER_DATA as ROUTER_DATA
+from .route import ROUTER_DATA_INCLUDE as ROUTER_DATA_INCLUDE
+from .route import DefaultPage as DefaultPage
+from .route import Page404 as Page404
+from .route import RouteArgType as RouteArgType
+from .route import RouteRegex as RouteRegex
+from .route import RouteVar as RouteVar
+from .style import STYLES_DIR as STYLES_DIR
+from .style import Tailwind as Tailwind
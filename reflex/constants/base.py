@@ -45,6 +45,8 @@ class Dirs(SimpleNamespace):
     REFLEX_JSON = os.path.join(WEB, "reflex.json")
     # The path to postcss.config.js
     POSTCSS_JS = os.path.join(WEB, "postcss.config.js")
+    # The directory where rendered component subtrees are cached between runs.
+    SUBTREE_CACHE = os.path.join(WEB, ".cache", "subtree-cache")
 
 
 class Reflex(SimpleNamespace):
@@ -185,6 +187,9 @@ SKIP_COMPILE_ENV_VAR = "__REFLEX_SKIP_COMPILE"
 # This env var stores the execution mode of the app
 ENV_MODE_ENV_VAR = "REFLEX_ENV_MODE"
 
+# If this env var is set to "1", sibling subtrees of each page are rendered in parallel processes
+PARALLEL_COMPILE_ENV_VAR = "REFLEX_PARALLEL_COMPILE"
+
 # Testing variables.
 # Testing os env set by pytest when running a test case.
 PYTEST_CURRENT_TEST = "PYTEST_CURRENT_TEST"
@@ -31,6 +31,7 @@ class Dirs(SimpleNamespace):
     ENV_JSON = os.path.join(WEB, "env.json")
     REFLEX_JSON = os.path.join(WEB, "reflex.json")
     POSTCSS_JS = os.path.join(WEB, "postcss.config.js")
+    SUBTREE_CACHE = os.path.join(WEB, ".cache", "subtree-cache")
 
 class Reflex(SimpleNamespace):
     MODULE_NAME = "reflex"
@@ -88,6 +89,7 @@ COOKIES = "cookies"
 LOCAL_STORAGE = "local_storage"
 SKIP_COMPILE_ENV_VAR = "__REFLEX_SKIP_COMPILE"
 ENV_MODE_ENV_VAR = "REFLEX_ENV_MODE"
+PARALLEL_COMPILE_ENV_VAR = "REFLEX_PARALLEL_COMPILE"
 PYTEST_CURRENT_TEST = "PYTEST_CURRENT_TEST"
 RELOAD_CONFIG = "__REFLEX_RELOAD_CONFIG"
 REFLEX_VAR_OPENING_TAG = "<reflex.Var>"
@@ -19,8 +19,14 @@ def merge_imports(*imports) -> ImportDict:
     """
     all_imports = defaultdict(list)
     for import_dict in imports:
+        # Most components contribute no imports of their own.
+        if not import_dict:
+            continue
         for lib, fields in import_dict.items():
-            all_imports[lib].extend(fields)
+            if lib in all_imports:
+                all_imports[lib] += fields
+            else:
+                all_imports[lib] = list(fields)
     return all_imports
 
 
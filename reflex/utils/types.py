@@ -454,6 +454,47 @@ def is_encoded_fstring(value) -> bool:
     return isinstance(value, str) and constants.REFLEX_VAR_OPENING_TAG in value
 
 
+# The allowed values of each Literal type checked so far, keyed by the id of the
+# type. Hashing a Literal type builds a new frozenset of its arguments, so the
+# type itself is kept in the entry instead of being used as the key.
+_LITERAL_VALUES: Dict[int, Tuple[Type, frozenset]] = {}
+
+
+def _get_literal_values(literal_type: Type) -> frozenset:
+    """Get the allowed values of a Literal type as a set.
+
+    Args:
+        literal_type: The Literal type.
+
+    Returns:
+        The allowed values.
+    """
+    entry = _LITERAL_VALUES.get(id(literal_type))
+    if entry is None:
+        entry = _LITERAL_VALUES[id(literal_type)] = (
+            literal_type,
+            frozenset(literal_type.__args__),
+        )
+    return entry[1]
+
+
+def _is_literal_value(value: Any, literal_type: Type) -> bool:
+    """Check whether a value is one of the allowed values of a Literal type.
+
+    Args:
+        value: The value to check.
+        literal_type: The Literal type.
+
+    Returns:
+        Whether the value is allowed.
+    """
+    try:
+        return value in _get_literal_values(literal_type)
+    except TypeError:
+        # Unhashable values can only be compared against each allowed value.
+        return value in literal_type.__args__
+
+
 def validate_literal(key: str, value: Any, expected_type: Type, comp_name: str):
     """Check that a value is a valid literal.
 
@@ -472,7 +513,7 @@ def validate_literal(key: str, value: Any, expected_type: Type, comp_name: str):
         is_literal(expected_type)
         and not isinstance(value, Var)  # validating vars is not supported yet.
         and not is_encoded_fstring(value)  # f-strings are not supported.
-        and value not in expected_type.__args__
+        and not _is_literal_value(value, expected_type)
     ):
         allowed_values = expected_type.__args__
         if value not in allowed_values:
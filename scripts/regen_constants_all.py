@@ -0,0 +1,123 @@
+"""Regenerate `__all__` and the stub of the reflex.constants package.
+
+The constants are declared once, in the `_SUBMODULE_ATTRS` mapping of
+reflex/constants/__init__.py (plus any `from .x import y` statements). The sorted
+`__all__` list and the re-exports in __init__.pyi are derived from it.
+"""
+
+import ast
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+logger = logging.getLogger("regen_constants_all")
+
+CONSTANTS_INIT = Path("reflex/constants/__init__.py")
+CONSTANTS_STUB = CONSTANTS_INIT.with_suffix(".pyi")
+
+
+def _get_exports(tree: ast.Module) -> Dict[str, List[str]]:
+    """Collect the names exported by the constants package.
+
+    Args:
+        tree: The parsed constants __init__ module.
+
+    Returns:
+        A mapping of submodule name to the names it provides.
+    """
+    exports: Dict[str, List[str]] = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module:
+            exports.setdefault(node.module, []).extend(
+                alias.asname or alias.name for alias in node.names
+            )
+        elif (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == "_SUBMODULE_ATTRS"
+            and node.value is not None
+        ):
+            for submodule, names in ast.literal_eval(node.value).items():
+                exports.setdefault(submodule, []).extend(names)
+    return exports
+
+
+def _format_all(names: List[str]) -> str:
+    """Format the `__all__` assignment.
+
+    Args:
+        names: The exported names.
+
+    Returns:
+        The source of the assignment.
+    """
+    lines = ["__all__ = ["]
+    lines.extend(f'    "{name}",' for name in sorted(set(names)))
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def _format_stub(exports: Dict[str, List[str]]) -> str:
+    """Format the stub file re-exporting every constant.
+
+    Args:
+        exports: A mapping of submodule name to the names it provides.
+
+    Returns:
+        The source of the stub file.
+    """
+    lines = [f'"""Stub file for {CONSTANTS_INIT.as_posix()}"""', ""]
+    lines.extend(
+        f"from . import {submodule} as {submodule}" for submodule in sorted(exports)
+    )
+    for submodule in sorted(exports):
+        lines.extend(
+            f"from .{submodule} import {name} as {name}" for name in exports[submodule]
+        )
+    return "\n".join(lines) + "\n"
+
+
+def regenerate() -> bool:
+    """Rewrite `__all__` in the constants package and its stub.
+
+    Returns:
+        Whether any file changed.
+
+    Raises:
+        ValueError: If the constants package has no `__all__` assignment.
+    """
+    source = CONSTANTS_INIT.read_text()
+    tree = ast.parse(source)
+    exports = _get_exports(tree)
+    new_all = _format_all([name for names in exports.values() for name in names])
+
+    lines = source.splitlines()
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "__all__"
+        ):
+            lines[node.lineno - 1 : node.end_lineno] = [new_all]
+            break
+    else:
+        raise ValueError(f"No __all__ assignment found in {CONSTANTS_INIT}")
+    new_source = "\n".join(lines) + "\n"
+
+    changed = False
+    for path, new_text in (
+        (CONSTANTS_INIT, new_source),
+        (CONSTANTS_STUB, _format_stub(exports)),
+    ):
+        if not path.exists() or path.read_text() != new_text:
+            logger.info(f"Updating {path}")
+            path.write_text(new_text)
+            changed = True
+    return changed
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(1 if regenerate() else 0)
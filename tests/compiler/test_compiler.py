@@ -1,10 +1,17 @@
+import datetime
+import json
 import os
+import platform
+import uuid
 from typing import List
 
 import pytest
 
-from reflex.compiler import compiler, utils
-from reflex.utils import imports
+import reflex as rx
+from reflex.compiler import _subtree_cache as subtree_cache
+from reflex.compiler import compiler, templates, utils
+from reflex.style import Style
+from reflex.utils import format, imports
 from reflex.utils.imports import ImportVar
 
 
@@ -219,3 +226,109 @@ def test_create_document_root():
     assert root.lang == "rx"  # type: ignore
     assert isinstance(root.custom_attrs, dict)
     assert root.custom_attrs == {"project": "reflex"}
+
+
+@pytest.mark.skipif(
+    platform.system() not in ("Linux", "Darwin"), reason="requires fork"
+)
+def test_prerender_sibling_subtrees():
+    """Test that sibling subtrees are rendered into the subtree cache."""
+    page = rx.center(rx.vstack(rx.text("first sibling"), rx.text("second sibling")))
+    siblings = page.children[0].children
+    subtree_cache.clear()
+
+    compiler.prerender_sibling_subtrees([page])
+    keys = [sibling._content_hash() for sibling in siblings]
+    prerendered = [subtree_cache.get(key) for key in keys]  # type: ignore
+    subtree_cache.clear()
+
+    assert prerendered == [sibling.render() for sibling in siblings]
+
+
+@pytest.mark.skipif(
+    platform.system() not in ("Linux", "Darwin"), reason="requires fork"
+)
+def test_prerender_memo_sibling_subtrees():
+    """Test that memoized custom component siblings are prerendered too."""
+
+    @rx.memo
+    def first_memo_box():
+        return rx.box("first")
+
+    @rx.memo
+    def second_memo_box():
+        return rx.box("second")
+
+    page = rx.fragment(first_memo_box(), second_memo_box())
+    subtree_cache.clear()
+
+    compiler.prerender_sibling_subtrees([page])
+    keys = [sibling._content_hash() for sibling in page.children]
+    prerendered = [subtree_cache.get(key) for key in keys]  # type: ignore
+    subtree_cache.clear()
+
+    assert prerendered == [sibling.render() for sibling in page.children]
+
+
+def test_prerender_sibling_subtrees_without_pool(monkeypatch):
+    """Test that the siblings are rendered serially when the pool cannot run.
+
+    Args:
+        monkeypatch: Pytest monkeypatch object.
+    """
+
+    def broken_pool(*args, **kwargs):
+        raise AssertionError("daemonic processes are not allowed to have children")
+
+    monkeypatch.setattr(compiler.concurrent.futures, "ProcessPoolExecutor", broken_pool)
+    page = rx.center(rx.vstack(rx.text("first sibling"), rx.text("second sibling")))
+    subtree_cache.clear()
+
+    compiler.prerender_sibling_subtrees([page])
+
+    for sibling in page.children[0].children:
+        assert subtree_cache.get(sibling._content_hash()) is None  # type: ignore
+    assert "second sibling" in str(page.render())
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": [1, 2.5, {"b": None}], "c": True, "d": "é"},
+        {1: "int key", "date": datetime.datetime(2024, 1, 1)},
+        {"big": 2**70},
+        {"state.s": {"hi": float("inf"), "lo": float("-inf")}},
+        {"nested": [[1.0, float("nan")]]},
+        {float("inf"): 1},
+        {"style": Style({"font_family": "Inter", ":hover": {"color": "red"}})},
+        {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+    ],
+)
+def test_template_json_dumps(obj):
+    """The template json filter produces the same JSON as format.json_dumps.
+
+    Args:
+        obj: The object to serialize.
+    """
+    result = templates._json_dumps(obj)
+    expected = format.json_dumps(obj)
+    # NaN never compares equal, so compare the parsed values by their repr.
+    assert repr(json.loads(result)) == repr(json.loads(expected))
+    assert "null" not in result or "null" in expected
+
+
+def test_compile_theme_json(monkeypatch):
+    """The compiled theme is the same with and without orjson.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    style = {"font_family": "Inter", rx.text: {"color": "red"}}
+    _, code = compiler.compile_theme(style)
+    monkeypatch.setattr(templates, "orjson", None)
+    _, baseline_code = compiler.compile_theme(style)
+
+    prefix = "export default "
+    theme = json.loads(code.strip()[len(prefix) :])
+    assert theme == json.loads(baseline_code.strip()[len(prefix) :])
+    assert theme["styles"]["global"]["body"] == {"fontFamily": "Inter"}
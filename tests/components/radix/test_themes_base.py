@@ -0,0 +1,47 @@
+import pytest
+
+from reflex.components.radix.themes.base import Theme
+
+
+def test_theme_accent_color_var_is_shared():
+    first = Theme.create(accent_color="plum")
+    second = Theme.create(accent_color="plum")
+
+    assert first.accent_color is second.accent_color
+    assert str(first.accent_color) == "plum"
+    assert "accentColor={`plum`}" in str(first)
+
+
+def test_theme_invalid_accent_color():
+    with pytest.raises(ValueError):
+        Theme.create(accent_color="not-a-color")
+
+
+def test_theme_render_css():
+    rendered = str(Theme.create())
+    assert (
+        "css={{...theme.styles.global[':root'], ...theme.styles.global.body}}"
+        in rendered
+    )
+
+
+def test_theme_get_imports():
+    theme_imports = Theme.create()._get_imports()
+    assert "/utils/theme.js" in theme_imports
+    assert "" in theme_imports
+    assert "react" not in theme_imports
+
+    # Instance specific imports are still collected per theme.
+    theme_with_ref_imports = Theme.create(id="theme")._get_imports()
+    assert "/utils/theme.js" in theme_with_ref_imports
+    assert any(var.tag == "useRef" for var in theme_with_ref_imports["react"])
+
+
+def test_app_wrap_color_mode_provider_is_shared():
+    first = Theme.create()._get_app_wrap_components()
+    second = Theme.create()._get_app_wrap_components()
+
+    assert first is not second
+    assert first == second
+    provider = first[(45, "RadixThemesColorModeProvider")]
+    assert provider is second[(45, "RadixThemesColorModeProvider")]
@@ -1,3 +1,5 @@
+import os
+import sys
 from contextlib import nullcontext
 from typing import Any, Dict, List, Optional, Type, Union
 
@@ -2059,3 +2061,127 @@ def test_add_style_foreach():
 
     # Expect only one instance of this CSS dict in the rendered page
     assert str(page).count('css={{"color": "red"}}') == 1
+
+
+def test_content_hash_identical_subtrees():
+    """Structurally identical subtrees share a content hash and a render."""
+    first = rx.box(rx.text("hello"), padding="1em")
+    second = rx.box(rx.text("hello"), padding="1em")
+    other = rx.box(rx.text("world"), padding="1em")
+
+    assert first._content_hash() is not None
+    assert first._content_hash() == second._content_hash()
+    assert first._content_hash() != other._content_hash()
+    assert first.render() is second.render()
+    assert first.render() != other.render()
+
+
+def test_content_hash_changes_on_mutation():
+    """A mutated component does not reuse the render of its previous state."""
+    comp = rx.box(rx.text("hello"))
+    before = comp.render()
+
+    comp.children[0].children[0].contents = Var.create("world", _var_is_string=True)  # type: ignore
+
+    after = comp.render()
+    assert after != before
+    assert "world" in after["children"][0]["children"][0]["contents"]
+
+
+def test_content_hash_unstable_values(test_state):
+    """Components holding values without a stable repr are not cached.
+
+    Args:
+        test_state: A test state.
+    """
+    comp = rx.box(on_click=test_state.do_something)
+
+    assert comp._content_hash() is None
+    assert comp.render() == comp.render()
+
+
+def test_content_hash_unsupported_values():
+    """Values whose repr may not capture their contents are not hashed."""
+    pd = pytest.importorskip("pandas")
+    rows = [[i, i] for i in range(1000)]
+    first = rx.data_table(data=pd.DataFrame(rows, columns=["a", "b"]))
+    rows[500] = [999999, 999999]
+    second = rx.data_table(data=pd.DataFrame(rows, columns=["a", "b"]))
+
+    assert first._content_hash() is None
+    assert "999999" not in str(first.render())
+    assert "999999" in str(second.render())
+
+
+def test_render_deep_tree():
+    """Trees deeper than the recursion limit still render."""
+    comp = rx.text("leaf")
+    for _ in range(sys.getrecursionlimit()):
+        comp = rx.box(comp)
+
+    rendered = comp.render()
+    depth = 0
+    while rendered["children"]:
+        rendered = rendered["children"][0]
+        depth += 1
+
+    # The boxes, then the text, then the bare string.
+    assert depth == sys.getrecursionlimit() + 1
+    assert rendered["contents"] == "{`leaf`}"
+
+
+def test_render_skips_unset_props():
+    """Only props that are set are rendered, with trailing underscores stripped."""
+    comp = rx.text("hi", as_="p")
+
+    assert ("as_", "as") in type(comp)._get_prop_names()
+    assert comp.render()["props"] == ["as={`p`}"]
+
+
+def test_subtree_cache_persistence(tmp_path, monkeypatch):
+    """Rendered subtrees survive a round trip through the on-disk cache.
+
+    Args:
+        tmp_path: A temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    from reflex.compiler import _subtree_cache as subtree_cache
+
+    monkeypatch.chdir(tmp_path)
+    comp = rx.box(rx.text("persisted"))
+    rendered = comp.render()
+    subtree_cache.save()
+
+    subtree_cache.clear()
+    monkeypatch.setattr(subtree_cache, "_loaded", False)
+    assert subtree_cache.get(comp._content_hash()) == rendered  # type: ignore
+
+
+def test_class_salt_covers_base_class_modules(tmp_path, monkeypatch):
+    """Editing the module of a base class changes the cache salt of subclasses.
+
+    Args:
+        tmp_path: A temporary directory.
+        monkeypatch: The pytest monkeypatch fixture.
+    """
+    from reflex.compiler import _subtree_cache as subtree_cache
+
+    base_file = tmp_path / "salt_base_mod.py"
+    base_file.write_text(
+        "from reflex.components.component import Component\n\n"
+        "class MyBase(Component):\n"
+        "    tag = 'div'\n"
+    )
+    (tmp_path / "salt_child_mod.py").write_text(
+        "from salt_base_mod import MyBase\n\nclass Child(MyBase):\n    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from salt_child_mod import Child  # type: ignore
+
+    salt = subtree_cache.get_class_salt(Child)
+    mtime = base_file.stat().st_mtime_ns + 10**9
+    os.utime(base_file, ns=(mtime, mtime))
+    subtree_cache.get_class_salt.cache_clear()
+    subtree_cache._get_module_mtime.cache_clear()
+
+    assert subtree_cache.get_class_salt(Child) != salt
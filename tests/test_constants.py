@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+from reflex import constants
+
+
+def test_all_names_resolve():
+    for name in constants.__all__:
+        assert getattr(constants, name) is not None
+
+
+def test_all_matches_lazy_mapping():
+    assert sorted(constants.__all__) == sorted(constants._ATTR_TO_SUBMODULE)
+
+
+def test_unknown_constant():
+    with pytest.raises(AttributeError):
+        constants.NOT_A_CONSTANT
+
+
+def test_submodule_access_in_fresh_process():
+    """Submodules are reachable as attributes before anything imports them."""
+    code = (
+        "from reflex import constants\n"
+        "assert 'pathname' in constants.route.ROUTER_DATA_INCLUDE\n"
+        "assert constants.route.ROUTER_DATA_INCLUDE is constants.ROUTER_DATA_INCLUDE\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -76,3 +76,14 @@ def test_merge_imports(input_1, input_2, output):
 
     for key in output:
         assert set(res[key]) == set(output[key])
+
+
+def test_merge_imports_does_not_mutate_inputs():
+    """Test that merging copies the import lists instead of extending them."""
+    input_1 = {"react": [ImportVar(tag="useEffect")]}
+    input_2 = {"react": [ImportVar(tag="useState")]}
+    res = merge_imports({}, input_1, input_2)
+
+    assert res["react"] == [ImportVar(tag="useEffect"), ImportVar(tag="useState")]
+    assert input_1 == {"react": [ImportVar(tag="useEffect")]}
+    assert input_2 == {"react": [ImportVar(tag="useState")]}
@@ -22,6 +22,12 @@ def test_validate_literal_error_msg(params, allowed_value_str, value_str):
     )
 
 
+def test_validate_literal_unhashable_value():
+    with pytest.raises(ValueError):
+        types.validate_literal("size", ["1"], Literal["1", "2", "3"], "Heading")
+    types.validate_literal("size", "2", Literal["1", "2", "3"], "Heading")
+
+
 @pytest.mark.parametrize(
     "cls,cls_check,expected",
     [